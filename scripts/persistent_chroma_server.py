@@ -1,11 +1,16 @@
 import os
 import uuid
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 import chromadb
 from chromadb.utils import embedding_functions
+from query_options import format_results, parse_query_options
 
-app = FastAPI()
+# Serialize responses with orjson and gzip anything larger than ~1KB
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 # Initialize Chroma client with new configuration
 client = chromadb.PersistentClient(path="./chroma_db")
@@ -25,22 +30,18 @@ collection = client.get_or_create_collection(
 @app.post("/query")
 async def query_endpoint(req: Request):
     body = await req.json()
-    user_query = body.get("query")
-    if not user_query:
-        return {"error": "Missing `query`"}
-    
+    options, error = parse_query_options(body)
+    if error:
+        return ORJSONResponse({"error": error}, status_code=400)
+
     results = collection.query(
-        query_texts=[user_query],
-        n_results=3
+        query_texts=[options["query"]],
+        n_results=options["n_results"],
+        include=options["include"]
     )
-    
-    # Format results to match existing structure
-    formatted_results = []
-    if results and results['documents']:
-        for doc in results['documents'][0]:  # First query's results
-            formatted_results.append({"document": doc})
-    
-    return {"results": formatted_results}
+
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return ORJSONResponse({"results": format_results(results, options)})
 
 @app.post("/add_documents")
 async def add_documents(req: Request):
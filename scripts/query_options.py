@@ -0,0 +1,102 @@
+from snippets import extract_snippets, tokenize_query
+
+# Response fields a client may request, mapped to Chroma's `include` names
+QUERY_FIELDS = {
+    "id": None,
+    "distance": "distances",
+    "metadata": "metadatas",
+    "document": "documents",
+}
+QUERY_MODES = ("full", "snippet")
+DEFAULT_FIELDS = ["document"]
+DEFAULT_N_RESULTS = 3
+
+# Snippet mode defaults: number of windows per document and window size in chars
+DEFAULT_SNIPPET_COUNT = 2
+DEFAULT_SNIPPET_SIZE = 400
+
+def positive_int_option(body: dict, key: str, default: int):
+    """Read an optional positive integer from the request body.
+
+    Returns the value and an error message (None when valid).
+    """
+    value = body.get(key)
+    if value is None:
+        return default, None
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return None, f"`{key}` must be a positive integer"
+    return value, None
+
+def parse_query_options(body: dict):
+    """Validate a /query request body.
+
+    Returns the parsed options and an error message (None when valid). The
+    options carry the Chroma `include` list to query with.
+    """
+    if not isinstance(body, dict):
+        return None, "Request body must be a JSON object"
+    query = body.get("query")
+    if not query or not isinstance(query, str):
+        return None, "Missing `query`"
+
+    # Projection: which fields to return for each hit
+    fields = body.get("fields")
+    if fields is None:
+        fields = list(DEFAULT_FIELDS)
+    if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+        return None, "`fields` must be a list of strings"
+    if not fields:
+        return None, "`fields` must not be empty"
+    unknown = [field for field in fields if field not in QUERY_FIELDS]
+    if unknown:
+        return None, f"Unknown fields: {', '.join(unknown)}"
+
+    # Snippet mode replaces the full document with its best passage windows
+    mode = body.get("mode")
+    if mode is None:
+        mode = "full"
+    if mode not in QUERY_MODES:
+        return None, "`mode` must be \"full\" or \"snippet\""
+
+    options = {"query": query, "fields": fields, "mode": mode}
+    for key, default in (
+        ("n_results", DEFAULT_N_RESULTS),
+        ("snippet_count", DEFAULT_SNIPPET_COUNT),
+        ("snippet_size", DEFAULT_SNIPPET_SIZE),
+    ):
+        options[key], error = positive_int_option(body, key, default)
+        if error:
+            return None, error
+
+    include = [QUERY_FIELDS[field] for field in fields if QUERY_FIELDS[field]]
+    if mode == "snippet" and "documents" not in include:
+        include.append("documents")
+    options["include"] = include
+    return options, None
+
+def format_results(results: dict, options: dict) -> list[dict]:
+    """Project the first query's Chroma results onto the requested fields."""
+    fields = options["fields"]
+    snippet_mode = options["mode"] == "snippet"
+    terms = tokenize_query(options["query"]) if snippet_mode else set()
+
+    formatted_results = []
+    if results and results['ids']:
+        for i, doc_id in enumerate(results['ids'][0]):
+            hit = {}
+            if "id" in fields:
+                hit["id"] = doc_id
+            if "distance" in fields:
+                hit["distance"] = results['distances'][0][i]
+            if "metadata" in fields:
+                hit["metadata"] = results['metadatas'][0][i]
+            if snippet_mode:
+                document = results['documents'][0][i]
+                # Entries stored without document text come back as None
+                hit["snippets"] = [] if document is None else extract_snippets(
+                    document, terms, options["snippet_count"], options["snippet_size"]
+                )
+            elif "document" in fields:
+                hit["document"] = results['documents'][0][i]
+            formatted_results.append(hit)
+    return formatted_results
@@ -0,0 +1,123 @@
+import bisect
+import math
+import re
+
+# Common German and English function words. They appear in nearly every
+# passage, so matching them says nothing about relevance.
+STOPWORDS = {
+    # German
+    "aber", "alle", "als", "also", "am", "an", "auch", "auf", "aus", "bei",
+    "bin", "bis", "bist", "da", "damit", "dann", "das", "dass", "dem", "den",
+    "der", "des", "die", "dies", "diese", "dieser", "dieses", "doch", "dort",
+    "du", "durch", "ein", "eine", "einem", "einen", "einer", "eines", "er",
+    "es", "etwa", "für", "gibt", "hat", "hatte", "haben", "ich", "ihr", "ihre",
+    "im", "in", "ist", "ja", "kann", "kein", "keine", "man", "mein", "mich",
+    "mir", "mit", "muss", "nach", "nicht", "noch", "nur", "ob", "oder", "sehr",
+    "sein", "seine", "sich", "sie", "sind", "so", "über", "um", "und", "uns",
+    "unter", "vom", "von", "vor", "wann", "war", "was", "weil", "welche",
+    "welcher", "welches", "wenn", "wer", "werden", "wie", "wir", "wird", "wo",
+    "zu", "zum", "zur",
+    # English
+    "about", "after", "all", "and", "any", "are", "can", "could", "did",
+    "does", "for", "from", "had", "has", "have", "her", "his", "how", "into",
+    "its", "may", "more", "not", "our", "out", "she", "should", "tell", "than",
+    "that", "the", "their", "them", "then", "there", "these", "they", "this",
+    "what", "when", "where", "which", "who", "why", "will", "with", "would",
+    "you", "your",
+}
+
+WORD_PATTERN = re.compile(r"\w+")
+
+def tokenize_query(query: str) -> set[str]:
+    """Lowercased query terms worth matching (drops short words and stopwords)."""
+    return {
+        term for term in WORD_PATTERN.findall(query.lower())
+        if len(term) >= 3 and term not in STOPWORDS
+    }
+
+def snap_window(document: str, start: int, end: int) -> tuple[int, int]:
+    """Widen [start, end) to whole words and strip surrounding whitespace."""
+    start = max(0, start)
+    end = min(len(document), end)
+    while start > 0 and not document[start - 1].isspace():
+        start -= 1
+    while end < len(document) and not document[end].isspace():
+        end += 1
+    while start < end and document[start].isspace():
+        start += 1
+    while end > start and document[end - 1].isspace():
+        end -= 1
+    return start, end
+
+def extract_snippets(document: str, terms: set[str], count: int, size: int) -> list[dict]:
+    """Return the `count` highest-scoring, non-overlapping windows of `document`.
+
+    A window scores the sum of its distinct matched terms, each weighted by
+    how rare the term is in the document, so one rare term outweighs many
+    repeats of a common one. Windows are widened to whole words. Each snippet
+    carries its offset in the document and highlight offsets relative to the
+    snippet text.
+    """
+    hits = [
+        (match.start(), match.end(), match.group().lower())
+        for match in WORD_PATTERN.finditer(document)
+        if match.group().lower() in terms
+    ]
+    if not hits:
+        start, end = snap_window(document, 0, size)
+        return [{"text": document[start:end], "offset": start, "highlights": []}]
+
+    counts = {}
+    for _, _, term in hits:
+        counts[term] = counts.get(term, 0) + 1
+    most_common = max(counts.values())
+    weights = {term: 1 + math.log(most_common / n) for term, n in counts.items()}
+
+    # Score a window anchored just before each hit. Windows only move forward,
+    # so a sliding [lo, hi) range over `hits` keeps term counts in O(hits).
+    candidates = []
+    window_counts = {}
+    score = 0.0
+    lo = hi = 0
+    for hit_start, _, _ in hits:
+        raw_start = max(0, min(hit_start - size // 4, len(document) - size))
+        start, end = snap_window(document, raw_start, raw_start + size)
+        while hi < len(hits) and hits[hi][1] <= end:
+            term = hits[hi][2]
+            window_counts[term] = window_counts.get(term, 0) + 1
+            if window_counts[term] == 1:
+                score += weights[term]
+            hi += 1
+        while lo < hi and hits[lo][0] < start:
+            term = hits[lo][2]
+            window_counts[term] -= 1
+            if window_counts[term] == 0:
+                score -= weights[term]
+            lo += 1
+        # Round away float drift from the running sum so ties stay ties
+        candidates.append((round(score, 9), hi - lo, start, end))
+    candidates.sort(key=lambda c: (-c[0], -c[1], c[2]))
+
+    chosen = []
+    for _, _, start, end in candidates:
+        if len(chosen) >= count:
+            break
+        if all(end <= other_start or start >= other_end for other_start, other_end in chosen):
+            chosen.append((start, end))
+
+    hit_starts = [s for s, _, _ in hits]
+    snippets = []
+    for start, end in sorted(chosen):
+        first = bisect.bisect_left(hit_starts, start)
+        last = bisect.bisect_left(hit_starts, end)
+        highlights = [
+            [s - start, e - start]
+            for s, e, _ in hits[first:last]
+            if e <= end
+        ]
+        snippets.append({
+            "text": document[start:end],
+            "offset": start,
+            "highlights": highlights,
+        })
+    return snippets
@@ -0,0 +1,87 @@
+import pytest
+
+from query_options import (
+    DEFAULT_N_RESULTS,
+    DEFAULT_SNIPPET_COUNT,
+    DEFAULT_SNIPPET_SIZE,
+    format_results,
+    parse_query_options,
+    positive_int_option,
+)
+
+@pytest.mark.parametrize("value", [0, -3, 2.5, "3", True, [3]])
+def test_positive_int_option_rejects_invalid_values(value):
+    assert positive_int_option({"n_results": value}, "n_results", 3) == (
+        None, "`n_results` must be a positive integer"
+    )
+
+def test_positive_int_option_uses_default_when_missing_or_null():
+    assert positive_int_option({}, "n_results", 3) == (3, None)
+    assert positive_int_option({"n_results": None}, "n_results", 3) == (3, None)
+    assert positive_int_option({"n_results": 7}, "n_results", 3) == (7, None)
+
+def test_defaults_match_previous_response_shape():
+    options, error = parse_query_options({"query": "IBW"})
+    assert error is None
+    assert options == {
+        "query": "IBW",
+        "fields": ["document"],
+        "mode": "full",
+        "n_results": DEFAULT_N_RESULTS,
+        "snippet_count": DEFAULT_SNIPPET_COUNT,
+        "snippet_size": DEFAULT_SNIPPET_SIZE,
+        "include": ["documents"],
+    }
+
+@pytest.mark.parametrize("body, error", [
+    ({}, "Missing `query`"),
+    ({"query": ""}, "Missing `query`"),
+    ({"query": 42}, "Missing `query`"),
+    ({"query": "IBW", "fields": "document"}, "`fields` must be a list of strings"),
+    ({"query": "IBW", "fields": 3}, "`fields` must be a list of strings"),
+    ({"query": "IBW", "fields": [1]}, "`fields` must be a list of strings"),
+    ({"query": "IBW", "fields": []}, "`fields` must not be empty"),
+    ({"query": "IBW", "fields": ["document", "bogus"]}, "Unknown fields: bogus"),
+    ({"query": "IBW", "mode": "foo"}, "`mode` must be \"full\" or \"snippet\""),
+    ({"query": "IBW", "n_results": 0}, "`n_results` must be a positive integer"),
+    ({"query": "IBW", "snippet_size": -5}, "`snippet_size` must be a positive integer"),
+    (["IBW"], "Request body must be a JSON object"),
+])
+def test_parse_query_options_rejects_invalid_bodies(body, error):
+    assert parse_query_options(body) == (None, error)
+
+def test_fields_map_to_chroma_include():
+    options, _ = parse_query_options({"query": "IBW", "fields": ["id", "distance", "metadata"]})
+    assert options["include"] == ["distances", "metadatas"]
+
+def test_snippet_mode_forces_documents_into_include():
+    options, _ = parse_query_options({"query": "IBW", "fields": ["id"], "mode": "snippet"})
+    assert options["include"] == ["documents"]
+
+def chroma_results(documents):
+    return {
+        "ids": [[f"doc-{i}" for i in range(len(documents))]],
+        "distances": [[0.1 * (i + 1) for i in range(len(documents))]],
+        "metadatas": [[{"section": "curriculum"} for _ in documents]],
+        "documents": [documents],
+    }
+
+def test_format_results_projects_requested_fields():
+    options, _ = parse_query_options({"query": "IBW", "fields": ["id", "distance"]})
+    assert format_results(chroma_results(["IBW Studium"]), options) == [
+        {"id": "doc-0", "distance": 0.1},
+    ]
+
+def test_format_results_returns_snippets_in_snippet_mode():
+    options, _ = parse_query_options({"query": "Praxissemester", "mode": "snippet"})
+    [hit] = format_results(chroma_results(["Das Praxissemester ist im fünften Semester."]), options)
+    assert "document" not in hit
+    assert hit["snippets"][0]["highlights"] == [[4, 18]]
+
+def test_format_results_handles_missing_document_text():
+    options, _ = parse_query_options({"query": "IBW", "fields": ["id"], "mode": "snippet"})
+    assert format_results(chroma_results([None]), options) == [{"id": "doc-0", "snippets": []}]
+
+def test_format_results_handles_empty_results():
+    options, _ = parse_query_options({"query": "IBW"})
+    assert format_results({"ids": []}, options) == []
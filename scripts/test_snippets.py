@@ -0,0 +1,75 @@
+import time
+
+from snippets import extract_snippets, tokenize_query
+
+def test_tokenize_query_drops_stopwords_and_short_words():
+    terms = tokenize_query("Was sind die Zulassungsvoraussetzungen für den Studiengang?")
+    assert terms == {"zulassungsvoraussetzungen", "studiengang"}
+
+def test_no_hits_returns_document_start():
+    document = "Das Studium dauert sieben Semester und endet mit dem Bachelor."
+    snippets = extract_snippets(document, {"ausland"}, count=2, size=20)
+    assert len(snippets) == 1
+    assert snippets[0]["offset"] == 0
+    assert snippets[0]["highlights"] == []
+    assert document.startswith(snippets[0]["text"])
+    assert document[len(snippets[0]["text"])] == " "
+
+def test_document_shorter_than_size():
+    document = "Auslandssemester im sechsten Semester."
+    snippets = extract_snippets(document, {"auslandssemester"}, count=2, size=400)
+    assert snippets == [{"text": document, "offset": 0, "highlights": [[0, 16]]}]
+
+def test_window_is_clamped_at_document_end():
+    document = "filler text " * 50 + "Bewerbung bis Mai"
+    snippets = extract_snippets(document, {"mai"}, count=1, size=40)
+    assert len(snippets) == 1
+    assert snippets[0]["text"].endswith("Bewerbung bis Mai")
+    assert snippets[0]["offset"] + len(snippets[0]["text"]) == len(document)
+
+def test_windows_snap_to_word_boundaries():
+    document = "Lorem ipsum dolor sit amet. " * 20 + "Praxissemester " + "consectetur adipiscing. " * 20
+    snippets = extract_snippets(document, {"praxissemester"}, count=1, size=57)
+    snippet = snippets[0]
+    start, end = snippet["offset"], snippet["offset"] + len(snippet["text"])
+    assert start == 0 or document[start - 1].isspace()
+    assert end == len(document) or document[end].isspace()
+    assert not snippet["text"][0].isspace() and not snippet["text"][-1].isspace()
+
+def test_windows_do_not_overlap():
+    document = " ".join(["Karriere Praxis"] * 100)
+    snippets = extract_snippets(document, {"karriere", "praxis"}, count=3, size=60)
+    assert len(snippets) == 3
+    for previous, current in zip(snippets, snippets[1:]):
+        assert previous["offset"] + len(previous["text"]) <= current["offset"]
+
+def test_highlights_point_at_matched_terms():
+    document = "Im IBW Studium ist ein Auslandssemester Pflicht. Das Auslandssemester dauert ein Semester."
+    terms = {"auslandssemester", "pflicht"}
+    for snippet in extract_snippets(document, terms, count=2, size=100):
+        assert snippet["highlights"]
+        for start, end in snippet["highlights"]:
+            assert snippet["text"][start:end].lower() in terms
+            assert document[snippet["offset"] + start:snippet["offset"] + end] == snippet["text"][start:end]
+
+def test_rare_term_beats_repeated_common_terms():
+    filler = "Die Studierenden für den Studiengang und die Stadt den Studiengang. "
+    document = (
+        filler * 15
+        + "Die Zulassungsvoraussetzungen sind die Hochschulreife und Englischkenntnisse. "
+        + filler * 15
+    )
+    terms = tokenize_query("Was sind die Zulassungsvoraussetzungen für den Studiengang?")
+    snippets = extract_snippets(document, terms, count=1, size=200)
+    assert "Zulassungsvoraussetzungen" in snippets[0]["text"]
+
+def test_large_document_with_many_hits_is_fast():
+    document = "IBW International Studium Praxis " * 4000
+    terms = tokenize_query("IBW international")
+    started = time.perf_counter()
+    snippets = extract_snippets(document, terms, count=2, size=400)
+    assert time.perf_counter() - started < 1.0
+    assert len(snippets) == 2
+    for snippet in snippets:
+        for start, end in snippet["highlights"]:
+            assert snippet["text"][start:end].lower() in terms
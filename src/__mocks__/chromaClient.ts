@@ -1,3 +1,5 @@
+import type { QueryOptions } from '../lib/chromaClient';
+
 export class ChromaService {
   private static instance: ChromaService;
   private baseDir: string = process.cwd();
@@ -9,7 +11,8 @@ export class ChromaService {
     return ChromaService.instance;
   }
 
-  public async query(query: string | any): Promise<string> {
+  // Options are accepted for signature parity; the server applies them
+  public async query(query: string | any, options: QueryOptions = {}): Promise<string> {
     // Handle invalid query types
     if (typeof query !== 'string') {
       return JSON.stringify({ error: "Invalid query type" });
@@ -1,6 +1,7 @@
 import { ChromaService } from '../__mocks__/chromaClient';
+import { POST } from '../app/api/vector/route';
 
-jest.mock('../lib/chromaClient');
+jest.mock('../lib/chromaClient', () => require('../__mocks__/chromaClient'));
 
 describe('Vector Search', () => {
   let chromaService: ChromaService;
@@ -93,4 +94,49 @@ describe('Vector Search', () => {
       expect(data.error).toBe('Invalid query type');
     });
   });
-}); 
\ No newline at end of file
+
+  describe('Vector Route', () => {
+    const routeRequest = (body: any) => ({ json: async () => body }) as any;
+
+    test('should forward fields and mode to the vector store', async () => {
+      const querySpy = jest.spyOn(ChromaService.prototype, 'query');
+
+      const response = await POST(routeRequest({
+        query: 'Tell me about studying abroad',
+        fields: ['metadata'],
+        mode: 'snippet'
+      }));
+
+      expect(response.status).toBe(200);
+      expect(querySpy).toHaveBeenCalledWith(
+        'Tell me about studying abroad',
+        expect.objectContaining({ fields: ['metadata'], mode: 'snippet' })
+      );
+      querySpy.mockRestore();
+    });
+
+    test('should pass invalid option errors through as 400', async () => {
+      const querySpy = jest.spyOn(ChromaService.prototype, 'query').mockResolvedValueOnce(
+        JSON.stringify({ error: '`mode` must be "full" or "snippet"', status: 400 })
+      );
+
+      const response = await POST(routeRequest({ query: 'IBW', mode: 'foo' }));
+      const data = await response.json();
+
+      expect(response.status).toBe(400);
+      expect(data.error).toBe('`mode` must be "full" or "snippet"');
+      querySpy.mockRestore();
+    });
+
+    test('should report vector store failures as 500', async () => {
+      const querySpy = jest.spyOn(ChromaService.prototype, 'query').mockResolvedValueOnce(
+        JSON.stringify({ error: 'Internal Server Error', status: 500 })
+      );
+
+      const response = await POST(routeRequest({ query: 'IBW' }));
+
+      expect(response.status).toBe(500);
+      querySpy.mockRestore();
+    });
+  });
+});
@@ -4,7 +4,7 @@ import { ChromaService } from '@/lib/chromaClient';
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
-    const { query } = body;
+    const { query, fields, mode, n_results, snippet_count, snippet_size } = body;
 
     if (!query) {
       return NextResponse.json(
@@ -15,19 +15,25 @@ export async function POST(request: NextRequest) {
 
     console.log('Vector API: Received query:', query);
     const chromaService = await ChromaService.getInstance();
-    const results = await chromaService.query(query);
-    console.log('Vector API: Raw results:', results);
+    const results = await chromaService.query(query, {
+      fields,
+      mode,
+      n_results,
+      snippet_count,
+      snippet_size
+    });
 
     try {
       // Try to parse the results
       const parsedResults = JSON.parse(results);
-      console.log('Vector API: Parsed results:', parsedResults);
-      
+
       if (parsedResults.error) {
         console.error('ChromaDB query error:', parsedResults.error);
+        // Invalid request options are the client's fault, not ours
+        const status = parsedResults.status === 400 ? 400 : 500;
         return NextResponse.json(
           { error: parsedResults.error },
-          { status: 500 }
+          { status }
         );
       }
 
@@ -1,6 +1,14 @@
 import { OpenAI } from 'openai';
 import env from './env';
 
+export interface QueryOptions {
+  fields?: Array<'id' | 'distance' | 'metadata' | 'document'>;
+  mode?: 'full' | 'snippet';
+  n_results?: number;
+  snippet_count?: number;
+  snippet_size?: number;
+}
+
 export class ChromaService {
   private static instance: ChromaService;
   private openai: OpenAI;
@@ -37,22 +45,29 @@ export class ChromaService {
     }
   }
 
-  public async query(query: string): Promise<string> {
+  public async query(query: string, options: QueryOptions = {}): Promise<string> {
     try {
       console.log('ChromaService: Querying with:', query);
       const response = await fetch('http://localhost:8000/query', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ query })
+        body: JSON.stringify({ query, ...options })
       });
 
       if (!response.ok) {
         const errorText = await response.text();
-        return JSON.stringify({ error: errorText });
+        // Keep the server's status so callers can tell client errors apart
+        let error = errorText;
+        try {
+          error = JSON.parse(errorText).error ?? errorText;
+        } catch {
+          // Not JSON; use the raw text
+        }
+        return JSON.stringify({ error, status: response.status });
       }
 
       const data = await response.json();
-      console.log('ChromaService: Query result:', data);
+      console.log('ChromaService: Query returned', data.results?.length ?? 0, 'results');
       return JSON.stringify(data);
     } catch (error) {
       console.error('ChromaDB query error:', error);
@@ -25,7 +25,7 @@ export class RagChatService {
     }
 
     const data = await res.json();
-    console.log('Vector API response:', data);
+    console.log('Vector API returned', data.results?.length ?? 0, 'results');
     
     if (data.error) {
       throw new Error(`Vector query failed: ${data.error}`);
@@ -48,7 +48,7 @@ export class RagChatService {
     console.log('Getting context...');
     const context = await this.getContext(userMessage);
     console.log(`Context retrieved in ${Date.now() - startTime}ms`);
-    console.log('Context:', context);
+    console.log(`Context length: ${context.length} chars`);
 
     // Create chat completion
     const response = await this.openai.chat.completions.create({